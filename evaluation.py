@@ -7,7 +7,7 @@ from models import MODELS, DEFAULT_MODEL
 
 console = Console()
 
-def get_openai_evaluation(commit_message, commit_diff, evaluation_prompt, model=DEFAULT_MODEL):
+def get_openai_evaluation(commit_message, commit_diff, evaluation_prompt, model=DEFAULT_MODEL, verbose=True):
     client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     evaluation_system_text = "Evaluating the commit message and diff to provide a summary."
     evaluation_text = f"{evaluation_prompt}\n\nCommit message: {commit_message}\n\nCommit diff:\n{commit_diff}"
@@ -46,7 +46,8 @@ def get_openai_evaluation(commit_message, commit_diff, evaluation_prompt, model=
             message_list.append({"role": "user", "content": continuation_prompt})
 
     # Display the response information
-    display_response_info(evaluation_system_text, evaluation_prompt, full_response, count_tokens(evaluation_text, model), model)
+    if verbose:
+        display_response_info(evaluation_system_text, evaluation_prompt, full_response, count_tokens(evaluation_text, model), model)
 
     # Return the full response
     return full_response.strip()
@@ -2,19 +2,36 @@
 
 import os
 import json
+import time
 import git
+from contextlib import nullcontext
 from datetime import datetime
+from openai import AuthenticationError, NotFoundError
 from rich.console import Console
 from rich.table import Table
-from utils import display_commit_info
+from utils import display_commit_info, create_commit_progress
 from evaluation import get_openai_evaluation, get_openai_summary
-from output import save_evaluation, save_summary
+from output import EvaluationWriter, save_summary
 
 console = Console()
 
-def get_commit_diff(commit):
+def get_commit_filters(author=None, since=None, until=None, exclude_merges=False):
+    # Keyword arguments for iter_commits, passed straight through to git rev-list
+    # so the filtering happens in the revision walk (and can use the commit-graph).
+    filters = {}
+    if author:
+        filters['author'] = author
+    if since:
+        filters['since'] = since
+    if until:
+        filters['until'] = until
+    if exclude_merges:
+        filters['no_merges'] = True
+    return filters
+
+def get_commit_diff(commit, paths=None):
     parent = commit.parents[0] if commit.parents else None
-    diff = commit.diff(parent, create_patch=True) if parent else commit.diff(None, create_patch=True)
+    diff = commit.diff(parent, paths=paths, create_patch=True) if parent else commit.diff(None, paths=paths, create_patch=True)
     diffs = []
     for d in diff:
         try:
@@ -23,11 +40,67 @@ def get_commit_diff(commit):
             diffs.append(d.diff.decode('latin-1'))
     return '\n'.join(diffs)
 
-def evaluate_specific_commit(repo, message, target_dir, branch, commit_id, author, model, output_format, output_dir, output_include_diff):
-    available_commits = [commit.hexsha for commit in repo.iter_commits(branch, author=author)]
+def evaluate_commit(commit, message, model, output_include_diff, paths=None, verbose=True):
+    if verbose:
+        display_commit_info(commit)
+    commit_diff = get_commit_diff(commit, paths) if output_include_diff else ""
+
+    evaluation = get_openai_evaluation(commit.message, commit_diff, message, model, verbose)
+    return {
+        "hash": commit.hexsha,
+        "author": commit.author.name,
+        "email": commit.author.email,
+        "date": str(commit.committed_datetime),
+        "message": commit.message.strip(),
+        "diff": commit_diff,
+        "evaluation": evaluation
+    }
+
+def evaluate_commits(commits, message, target_dir, model, output_format, output_dir, output_include_diff, paths=None, display='tables'):
+    # display is 'tables' (full per-commit tables), 'progress' (a single live progress bar)
+    # or 'quiet' (only a final one-line report). Outside 'tables' mode a failed commit is
+    # counted and skipped instead of aborting the whole run, unless the error would fail every
+    # commit the same way (bad API key, unknown model).
+    verbose = display == 'tables'
+    evaluated_commits = []
+    errors = 0
+    start_time = time.monotonic()
+
+    with EvaluationWriter(output_dir or target_dir, output_format, output_include_diff, verbose) as writer:
+        progress = create_commit_progress() if display == 'progress' else nullcontext()
+        with progress:
+            if display == 'progress':
+                task = progress.add_task("evaluate", total=len(commits), errors=0)
+
+            for commit in commits:
+                try:
+                    eval_data = evaluate_commit(commit, message, model, output_include_diff, paths, verbose)
+                except (AuthenticationError, NotFoundError, KeyError):
+                    raise
+                except Exception as e:
+                    if verbose:
+                        raise
+                    errors += 1
+                    console.print(f"[bold red]Error:[/bold red] Failed to evaluate commit {commit.hexsha}: {e}")
+                else:
+                    writer.submit(eval_data)
+                    evaluated_commits.append(commit.hexsha)
+
+                if display == 'progress':
+                    progress.update(task, advance=1, errors=errors + writer.errors)
+
+    if not verbose:
+        elapsed = time.monotonic() - start_time
+        console.print(f"[bold blue]Evaluated {len(evaluated_commits)} of {len(commits)} commits in {elapsed:.1f}s[/bold blue] ({errors + writer.errors} errors)")
+
+    return evaluated_commits
+
+def evaluate_specific_commit(repo, message, target_dir, branch, commit_id, author, model, output_format, output_dir, output_include_diff, paths=None, since=None, until=None, exclude_merges=False, display='tables'):
+    filters = get_commit_filters(author, since, until, exclude_merges)
+    available_commits = [commit.hexsha for commit in repo.iter_commits(branch, paths or '', **filters)]
 
     if commit_id not in available_commits:
-        raise ValueError(f"The commit hash {commit_id} could not be found in the repository.")
+        raise ValueError(f"The commit hash {commit_id} could not be found in the repository with the specified filters.")
     
     try:
         commit = repo.commit(commit_id)
@@ -35,127 +108,46 @@ def evaluate_specific_commit(repo, message, target_dir, branch, commit_id, autho
         raise ValueError(f"The commit hash {commit_id} could not be found in the repository.")
     except Exception as e:
         raise ValueError(f"An error occurred while retrieving the commit {commit_id}: {e}")
-    
-    display_commit_info(commit)
-    commit_diff = get_commit_diff(commit) if output_include_diff else ""
 
-    evaluation = get_openai_evaluation(commit.message, commit_diff, message, model)
-    eval_data = {
-        "hash": commit.hexsha,
-        "author": commit.author.name,
-        "email": commit.author.email,
-        "date": str(commit.committed_datetime),
-        "message": commit.message.strip(),
-        "diff": commit_diff,
-        "evaluation": evaluation
-    }
-    save_evaluation(eval_data, output_dir or target_dir, output_format)
+    return evaluate_commits([commit], message, target_dir, model, output_format, output_dir, output_include_diff, paths, display)
 
-    return [commit.hexsha]
+def evaluate_last_commit(repo, message, target_dir, branch, author, model, output_format, output_dir, output_include_diff, paths=None, since=None, until=None, exclude_merges=False, display='tables'):
+    filters = get_commit_filters(author, since, until, exclude_merges)
 
-def evaluate_last_commit(repo, message, target_dir, branch, author, model, output_format, output_dir, output_include_diff):
     try:
-        commit = next(repo.iter_commits(branch, max_count=1, author=author))
+        commit = next(repo.iter_commits(branch, paths or '', max_count=1, **filters))
     except StopIteration:
-        raise ValueError(f"No commits found in the branch {branch} by the specified author.")
-    
-    display_commit_info(commit)
-    commit_diff = get_commit_diff(commit) if output_include_diff else ""
+        raise ValueError(f"No commits found in the branch {branch} matching the specified filters.")
 
-    evaluation = get_openai_evaluation(commit.message, commit_diff, message, model)
-    eval_data = {
-        "hash": commit.hexsha,
-        "author": commit.author.name,
-        "email": commit.author.email,
-        "date": str(commit.committed_datetime),
-        "message": commit.message.strip(),
-        "diff": commit_diff,
-        "evaluation": evaluation
-    }
-    save_evaluation(eval_data, output_dir or target_dir, output_format)
+    return evaluate_commits([commit], message, target_dir, model, output_format, output_dir, output_include_diff, paths, display)
 
-    return [commit.hexsha]
+def evaluate_last_n_commits(repo, message, target_dir, branch, author, n, model, output_format, output_dir, output_include_diff, paths=None, since=None, until=None, exclude_merges=False, display='tables'):
+    filters = get_commit_filters(author, since, until, exclude_merges)
 
-def evaluate_last_n_commits(repo, message, target_dir, branch, author, n, model, output_format, output_dir, output_include_diff):
     try:
-        commits = list(repo.iter_commits(branch, max_count=n, author=author))
+        commits = list(repo.iter_commits(branch, paths or '', max_count=n, **filters))
         if not commits:
-            raise ValueError(f"No commits found in the branch {branch} by the specified author.")
+            raise ValueError(f"No commits found in the branch {branch} matching the specified filters.")
     except git.exc.GitCommandError as e:
         raise ValueError(f"An error occurred while retrieving the last {n} commits: {e}")
 
-    evaluated_commits = []
+    return evaluate_commits(commits, message, target_dir, model, output_format, output_dir, output_include_diff, paths, display)
 
-    for commit in commits:
-        display_commit_info(commit)
-        commit_diff = get_commit_diff(commit) if output_include_diff else ""
-
-        evaluation = get_openai_evaluation(commit.message, commit_diff, message, model)
-        eval_data = {
-            "hash": commit.hexsha,
-            "author": commit.author.name,
-            "email": commit.author.email,
-            "date": str(commit.committed_datetime),
-            "message": commit.message.strip(),
-            "diff": commit_diff,
-            "evaluation": evaluation
-        }
-        save_evaluation(eval_data, output_dir or target_dir, output_format)
-
-        evaluated_commits.append(commit.hexsha)
+def evaluate_commit_range(repo, message, target_dir, branch, start_commit, end_commit, author, model, output_format, output_dir, output_include_diff, paths=None, since=None, until=None, exclude_merges=False, display='tables'):
+    filters = get_commit_filters(author, since, until, exclude_merges)
 
-    return evaluated_commits
-
-def evaluate_commit_range(repo, message, target_dir, branch, start_commit, end_commit, author, model, output_format, output_dir, output_include_diff):
     try:
-        commits = list(repo.iter_commits(f'{start_commit}..{end_commit}', author=author))
+        commits = list(repo.iter_commits(f'{start_commit}..{end_commit}', paths or '', **filters))
     except git.exc.GitCommandError as e:
         raise ValueError(f"An error occurred while retrieving the commit range {start_commit}..{end_commit}: {e}")
 
-    evaluated_commits = []
-
-    for commit in commits:
-        display_commit_info(commit)
-        commit_diff = get_commit_diff(commit) if output_include_diff else ""
-
-        evaluation = get_openai_evaluation(commit.message, commit_diff, message, model)
-        eval_data = {
-            "hash": commit.hexsha,
-            "author": commit.author.name,
-            "email": commit.author.email,
-            "date": str(commit.committed_datetime),
-            "message": commit.message.strip(),
-            "diff": commit_diff,
-            "evaluation": evaluation
-        }
-        save_evaluation(eval_data, output_dir or target_dir, output_format)
-
-        evaluated_commits.append(commit.hexsha)
-
-    return evaluated_commits
-
-def evaluate_all_commits(repo, message, target_dir, branch, author, model, output_format, output_dir, output_include_diff):
-    evaluated_commits = []
+    return evaluate_commits(commits, message, target_dir, model, output_format, output_dir, output_include_diff, paths, display)
 
-    for commit in repo.iter_commits(branch, author=author):
-        display_commit_info(commit)
-        commit_diff = get_commit_diff(commit) if output_include_diff else ""
-
-        evaluation = get_openai_evaluation(commit.message, commit_diff, message, model)
-        eval_data = {
-            "hash": commit.hexsha,
-            "author": commit.author.name,
-            "email": commit.author.email,
-            "date": str(commit.committed_datetime),
-            "message": commit.message.strip(),
-            "diff": commit_diff,
-            "evaluation": evaluation
-        }
-        save_evaluation(eval_data, output_dir or target_dir, output_format)
-
-        evaluated_commits.append(commit.hexsha)
+def evaluate_all_commits(repo, message, target_dir, branch, author, model, output_format, output_dir, output_include_diff, paths=None, since=None, until=None, exclude_merges=False, display='tables'):
+    filters = get_commit_filters(author, since, until, exclude_merges)
+    commits = list(repo.iter_commits(branch, paths or '', **filters))
 
-    return evaluated_commits
+    return evaluate_commits(commits, message, target_dir, model, output_format, output_dir, output_include_diff, paths, display)
 
 def generate_summary(target_dir, summary_prompt, branch, evaluated_commits, model, output_format, output_dir, output_include_diff):
     eval_dir = os.path.join(output_dir or target_dir, '.git-evaluate')
@@ -27,12 +27,19 @@ def main():
     parser.add_argument('--target-dir', help='Target directory containing the git repository.')
     parser.add_argument('--branch', help='Branch to evaluate commits from.')
     parser.add_argument('--author', help='Filter commits by author.')
+    parser.add_argument('--path', action='append', help='Only evaluate commits touching this path (can be repeated). Diffs are limited to the matching paths.')
+    parser.add_argument('--since', help='Only evaluate commits more recent than this date (e.g. 2024-01-01 or "3 months ago").')
+    parser.add_argument('--until', help='Only evaluate commits older than this date.')
+    parser.add_argument('--exclude-merges', action='store_true', help='Skip merge commits.')
     parser.add_argument('--summary', help='Generate a summary of all evaluations with a prompt message.')
     parser.add_argument('--model', help='Specify the model to use for evaluation (default: gpt-4o-2024-05-13)')
     parser.add_argument('--config-file', help='Path to a configuration file with OpenAI API key and other settings.')
     parser.add_argument('--output-format', choices=['json', 'text'], help='Format of the output evaluation file.')
     parser.add_argument('--output-dir', help='Directory to save the output evaluation files.')
     parser.add_argument('--output-include-diff', action='store_true', help='Include the commit diff in the output evaluation file.')
+    display_group = parser.add_mutually_exclusive_group()
+    display_group.add_argument('--progress', action='store_true', help='Show a single live progress bar instead of per-commit tables.')
+    display_group.add_argument('--quiet', action='store_true', help='Suppress per-commit output and only report totals at the end.')
     
     # New query arguments
     parser.add_argument('--list-branches', action='store_true', help='List all branches in the repository.')
@@ -139,24 +146,33 @@ def main():
     console.print(f"[bold blue]Using branch:[/bold blue] {branch}")
 
     evaluated_commits = []
+    commit_filters = {
+        "paths": args.path,
+        "since": args.since,
+        "until": args.until,
+        "exclude_merges": args.exclude_merges
+    }
+    display = 'quiet' if args.quiet else 'progress' if args.progress else 'tables'
 
     try:
         # Evaluate commits based on the provided arguments
         if evaluate == 'all':
-            evaluated_commits = evaluate_all_commits(repo, message, target_dir, branch, args.author, default_model, output_format, output_dir, output_include_diff)
+            evaluated_commits = evaluate_all_commits(repo, message, target_dir, branch, args.author, default_model, output_format, output_dir, output_include_diff, **commit_filters, display=display)
         elif evaluate.startswith('last:'):
             n = int(evaluate.split(':')[1])
-            evaluated_commits = evaluate_last_n_commits(repo, message, target_dir, branch, args.author, n, default_model, output_format, output_dir, output_include_diff)
+            evaluated_commits = evaluate_last_n_commits(repo, message, target_dir, branch, args.author, n, default_model, output_format, output_dir, output_include_diff, **commit_filters, display=display)
         elif evaluate == 'last':
-            evaluated_commits = evaluate_last_commit(repo, message, target_dir, branch, args.author, default_model, output_format, output_dir, output_include_diff)
+            evaluated_commits = evaluate_last_commit(repo, message, target_dir, branch, args.author, default_model, output_format, output_dir, output_include_diff, **commit_filters, display=display)
         elif ':' in evaluate:
             start_commit, end_commit = evaluate.split(':')
-            evaluated_commits = evaluate_commit_range(repo, message, target_dir, branch, start_commit, end_commit, args.author, default_model, output_format, output_dir, output_include_diff)
+            evaluated_commits = evaluate_commit_range(repo, message, target_dir, branch, start_commit, end_commit, args.author, default_model, output_format, output_dir, output_include_diff, **commit_filters, display=display)
         else:
-            evaluated_commits = evaluate_specific_commit(repo, message, target_dir, branch, evaluate, args.author, default_model, output_format, output_dir, output_include_diff)
+            evaluated_commits = evaluate_specific_commit(repo, message, target_dir, branch, evaluate, args.author, default_model, output_format, output_dir, output_include_diff, **commit_filters, display=display)
         
         # Generate a summary if the option is provided
-        if summary:
+        if summary and not evaluated_commits:
+            console.print("[bold yellow]Warning:[/bold yellow] No commits were evaluated, skipping the summary.")
+        elif summary:
             generate_summary(target_dir, summary, branch, evaluated_commits, default_model, output_format, output_dir, output_include_diff)
         
     except ValueError as ve:
@@ -2,19 +2,58 @@
 
 import os
 import json
+import queue
+import tempfile
+import threading
+from contextlib import contextmanager
 from rich.console import Console
 from datetime import datetime 
 
 console = Console()
 
-def save_evaluation_json(eval_data, eval_file, output_include_diff=False):
-    with open(eval_file, 'w') as f:
+# mkstemp creates files as 0600; evaluation files should get the same mode open() would give them.
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+@contextmanager
+def atomic_open(file_path):
+    # Write to a temporary file in the same directory and move it into place,
+    # so readers never see a partially written evaluation.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o666 & ~UMASK)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def fsync_dir(dir_path):
+    # Make the renames in dir_path durable. Directories can't be opened this way on Windows.
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def save_evaluation_json(eval_data, eval_file, output_include_diff=False, verbose=True):
+    with atomic_open(eval_file) as f:
         json.dump(eval_data, f, indent=4)
     
-    console.print(f"\n[bold green]Evaluation saved to:[/bold green] {eval_file}")
+    if verbose:
+        console.print(f"\n[bold green]Evaluation saved to:[/bold green] {eval_file}")
 
-def save_evaluation_text(eval_data, eval_file, output_include_diff=False):
-    with open(eval_file, 'w') as f:
+def save_evaluation_text(eval_data, eval_file, output_include_diff=False, verbose=True):
+    with atomic_open(eval_file) as f:
         f.write(f"Commit Hash: {eval_data['hash']}\n")
         f.write(f"Author: {eval_data['author']}\n")
         f.write(f"Email: {eval_data['email']}\n")
@@ -28,24 +67,84 @@ def save_evaluation_text(eval_data, eval_file, output_include_diff=False):
         f.write("\n\nEvaluation:\n")
         f.write(eval_data['evaluation'])
     
-    console.print(f"\n[bold green]Evaluation saved to:[/bold green] {eval_file}")
+    if verbose:
+        console.print(f"\n[bold green]Evaluation saved to:[/bold green] {eval_file}")
 
-def save_evaluation(eval_data, target_dir, output_format='json', output_include_diff=False):
+def save_evaluation(eval_data, target_dir, output_format='json', output_include_diff=False, verbose=True):
     eval_dir = os.path.join(target_dir, '.git-evaluate')
-    if not os.path.exists(eval_dir):
-        os.makedirs(eval_dir)
+    os.makedirs(eval_dir, exist_ok=True)
     
     eval_file = os.path.join(eval_dir, f"{eval_data['hash']}.{output_format}")
     
     if output_format == 'json':
-        save_evaluation_json(eval_data, eval_file, output_include_diff)
+        save_evaluation_json(eval_data, eval_file, output_include_diff, verbose)
     elif output_format == 'text':
-        save_evaluation_text(eval_data, eval_file, output_include_diff)
+        save_evaluation_text(eval_data, eval_file, output_include_diff, verbose)
     else:
         raise ValueError(f"Unsupported output format: {output_format}")
     
     return eval_file
 
+# Saves evaluations on a background thread so the commit loop never waits on disk.
+# Queued evaluations are written as a batch, each file atomically, and the batch is
+# committed with a single fsync of the output directory. In verbose mode evaluations are
+# saved synchronously instead, so "Evaluation saved to" stays in order with the commit tables.
+# Call close() (or leave the with block) before reading the files back to flush pending writes.
+class EvaluationWriter:
+    def __init__(self, target_dir, output_format='json', output_include_diff=False, verbose=True, batch_size=32):
+        if output_format not in ('json', 'text'):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.target_dir = target_dir
+        self.output_format = output_format
+        self.output_include_diff = output_include_diff
+        self.verbose = verbose
+        self.batch_size = batch_size
+        self.errors = 0
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, eval_data):
+        if self.verbose:
+            save_evaluation(eval_data, self.target_dir, self.output_format, self.output_include_diff, self.verbose)
+        else:
+            self.queue.put(eval_data)
+
+    def run(self):
+        done = False
+        while not done:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            written = False
+            for eval_data in batch:
+                if eval_data is None:
+                    done = True
+                    continue
+                try:
+                    save_evaluation(eval_data, self.target_dir, self.output_format, self.output_include_diff, self.verbose)
+                    written = True
+                except Exception as e:
+                    self.errors += 1
+                    console.print(f"[bold red]Error:[/bold red] Failed to save evaluation for {eval_data['hash']}: {e}")
+
+            if written:
+                fsync_dir(os.path.join(self.target_dir, '.git-evaluate'))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 def save_summary(summary_data, target_dir, branch, output_format='json', output_include_diff=False):
     eval_dir = os.path.join(target_dir, '.git-evaluate')
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
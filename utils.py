@@ -1,5 +1,10 @@
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+from rich.progress import (
+    Progress, ProgressColumn, TextColumn, BarColumn, MofNCompleteColumn,
+    TimeElapsedColumn, TimeRemainingColumn
+)
 from models import MODELS, DEFAULT_MODEL
 import tiktoken
 
@@ -40,3 +45,23 @@ def display_response_info(system_text, user_prompt, response, total_tokens, mode
     table.add_row("Response", response, style="green")
 
     console.print(table)
+
+class CommitRateColumn(ProgressColumn):
+    def render(self, task):
+        speed = task.finished_speed or task.speed
+        if speed is None:
+            return Text("-- commits/min", style="progress.data.speed")
+        return Text(f"{speed * 60:.1f} commits/min", style="progress.data.speed")
+
+def create_commit_progress():
+    return Progress(
+        TextColumn("[bold blue]Evaluating"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        CommitRateColumn(),
+        TimeElapsedColumn(),
+        TextColumn("ETA"),
+        TimeRemainingColumn(),
+        TextColumn("[bold red]{task.fields[errors]} errors"),
+        console=console,
+    )